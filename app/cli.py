@@ -0,0 +1,27 @@
+import argparse
+import asyncio
+
+from app.db.session import SessionLocal
+import app.models.user, app.models.course, app.models.enrollment, app.models.audit
+from app.services import enrollment_svc
+
+
+async def _reconcile_counts(args) -> None:
+    async with SessionLocal() as db:
+        fixed = await enrollment_svc.reconcile_counts(db)
+    print(f"reconciled enrolled_count on {fixed} course(s)")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="course-platform")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = sub.add_parser("reconcile-counts", help="rebuild course seat counters from enrollments")
+    reconcile.set_defaults(handler=_reconcile_counts)
+
+    args = parser.parse_args(argv)
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -16,10 +16,12 @@ async def list_courses(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     title: str | None = Query(None),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(True),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        data = await course_svc.list_courses(db, page, size, title_filter=title)
+        data = await course_svc.list_courses(db, page, size, title_filter=title, cursor=cursor, with_total=with_total)
         return data
     except HTTPException:
         raise
@@ -61,11 +61,13 @@ async def remove_enrollment(
 async def list_enrollments(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(True),
     admin: User = Depends(require_role("admin")),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        return await enrollment_svc.list_all(db, page, size)
+        return await enrollment_svc.list_all(db, page, size, cursor=cursor, with_total=with_total)
     except HTTPException:
         raise
     except Exception as exc:
@@ -80,11 +82,13 @@ async def enrollments_for_course(
     course_id: str,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(True),
     admin: User = Depends(require_role("admin")),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        return await enrollment_svc.list_by_course(db, course_id, page, size)
+        return await enrollment_svc.list_by_course(db, course_id, page, size, cursor=cursor, with_total=with_total)
     except HTTPException:
         raise
     except Exception as exc:
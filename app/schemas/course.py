@@ -43,6 +43,7 @@ class CourseOut(BaseModel):
 
 class CourseListOut(BaseModel):
     items: list[CourseOut]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
+    next_cursor: Optional[str] = None
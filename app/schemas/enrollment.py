@@ -21,6 +21,7 @@ class EnrollmentOut(BaseModel):
 
 class EnrollmentListOut(BaseModel):
     items: list[EnrollmentOut]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
+    next_cursor: Optional[str] = None
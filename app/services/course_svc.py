@@ -5,31 +5,48 @@ from fastapi import HTTPException, status
 from datetime import datetime, timezone
 
 from app.models.course import Course
-
-
-async def list_courses(db: AsyncSession, page: int, size: int, title_filter: str | None = None, active_only: bool = True):
+from app.utils.pagination import after_cursor, next_cursor
+
+
+async def list_courses(
+    db: AsyncSession,
+    page: int,
+    size: int,
+    title_filter: str | None = None,
+    active_only: bool = True,
+    cursor: str | None = None,
+    with_total: bool = True,
+):
     try:
-        q = select(Course).where(Course.deleted_at.is_(None))
-        count_q = select(sa_func.count()).select_from(Course).where(Course.deleted_at.is_(None))
-
+        filters = [Course.deleted_at.is_(None)]
         if active_only:
-            q = q.where(Course.is_active == True)
-            count_q = count_q.where(Course.is_active == True)
-
+            filters.append(Course.is_active == True)
         if title_filter:
-            q = q.where(Course.title.ilike(f"%{title_filter}%"))
-            count_q = count_q.where(Course.title.ilike(f"%{title_filter}%"))
-
-        total_result = await db.execute(count_q)
-        total = total_result.scalar()
-
-        offset = (page - 1) * size
-        q = q.offset(offset).limit(size).order_by(Course.created_at.desc())
-        result = await db.execute(q)
+            filters.append(Course.title.ilike(f"%{title_filter}%"))
+
+        total = None
+        if with_total:
+            total_result = await db.execute(select(sa_func.count()).select_from(Course).where(*filters))
+            total = total_result.scalar()
+
+        q = select(Course).where(*filters).order_by(Course.created_at.desc(), Course.id.desc())
+        if cursor:
+            q = q.where(after_cursor(Course.created_at, Course.id, cursor))
+        else:
+            q = q.offset((page - 1) * size)
+        result = await db.execute(q.limit(size + 1))
         courses = result.scalars().all()
 
-        return {"items": courses, "total": total, "page": page, "size": size}
+        return {
+            "items": courses[:size],
+            "total": total,
+            "page": page,
+            "size": size,
+            "next_cursor": next_cursor(courses, size),
+        }
 
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func as sa_func
+from sqlalchemy import select, update, delete, func as sa_func
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 import json
@@ -7,6 +7,7 @@ import json
 from app.models.enrollment import Enrollment
 from app.models.course import Course
 from app.models.audit import AuditLog
+from app.utils.pagination import after_cursor, next_cursor
 
 
 async def _write_audit(db: AsyncSession, entity_id: str, action: str, actor_id: str, extra: dict | None = None):
@@ -23,28 +24,53 @@ async def _write_audit(db: AsyncSession, entity_id: str, action: str, actor_id:
         pass
 
 
-async def enroll(db: AsyncSession, user_id: str, course_id: str) -> Enrollment:
-    try:
-        course_result = await db.execute(select(Course).where(Course.id == course_id, Course.deleted_at.is_(None)))
-        course = course_result.scalar_one_or_none()
-        if not course:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="course not found")
+async def _reject_enroll(db: AsyncSession, user_id: str, course_id: str):
+    # slow path: the seat claim matched no row, work out why
+    course_result = await db.execute(select(Course).where(Course.id == course_id, Course.deleted_at.is_(None)))
+    course = course_result.scalar_one_or_none()
+    if not course:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="course not found")
 
-        if not course.is_active:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="course is not active")
+    if not course.is_active:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="course is not active")
 
-        dup = await db.execute(
-            select(Enrollment).where(Enrollment.user_id == user_id, Enrollment.course_id == course_id)
-        )
-        if dup.scalar_one_or_none():
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="already enrolled in this course")
+    dup = await db.execute(
+        select(Enrollment.id).where(Enrollment.user_id == user_id, Enrollment.course_id == course_id)
+    )
+    if dup.scalar_one_or_none():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="already enrolled in this course")
+
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="course is full")
 
-        count_result = await db.execute(
-            select(sa_func.count()).select_from(Enrollment).where(Enrollment.course_id == course_id)
+
+async def _release_seat(db: AsyncSession, course_id: str):
+    await db.execute(
+        update(Course)
+        .where(Course.id == course_id, Course.enrolled_count > 0)
+        .values(enrolled_count=Course.enrolled_count - 1, updated_at=Course.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def enroll(db: AsyncSession, user_id: str, course_id: str) -> Enrollment:
+    try:
+        # claim a seat atomically, the row lock on the course serialises concurrent enrolls.
+        # seat counter changes are not course edits so updated_at is kept as is
+        claimed = await db.execute(
+            update(Course)
+            .where(
+                Course.id == course_id,
+                Course.deleted_at.is_(None),
+                Course.is_active == True,
+                Course.enrolled_count < Course.capacity,
+            )
+            .values(enrolled_count=Course.enrolled_count + 1, updated_at=Course.updated_at)
+            .returning(Course.id)
+            .execution_options(synchronize_session=False)
         )
-        current_count = count_result.scalar()
-        if current_count >= course.capacity:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="course is full")
+        if claimed.scalar_one_or_none() is None:
+            await db.rollback()
+            await _reject_enroll(db, user_id, course_id)
 
         enrollment = Enrollment(user_id=user_id, course_id=course_id)
         db.add(enrollment)
@@ -71,14 +97,17 @@ async def enroll(db: AsyncSession, user_id: str, course_id: str) -> Enrollment:
 async def deregister(db: AsyncSession, user_id: str, enrollment_id: str) -> None:
     try:
         result = await db.execute(
-            select(Enrollment).where(Enrollment.id == enrollment_id, Enrollment.user_id == user_id)
+            delete(Enrollment)
+            .where(Enrollment.id == enrollment_id, Enrollment.user_id == user_id)
+            .returning(Enrollment.course_id)
+            .execution_options(synchronize_session=False)
         )
-        enrollment = result.scalar_one_or_none()
-        if not enrollment:
+        course_id = result.scalar_one_or_none()
+        if not course_id:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="enrollment not found")
 
-        await _write_audit(db, enrollment.id, "deregistered", user_id, {"course_id": enrollment.course_id})
-        await db.delete(enrollment)
+        await _release_seat(db, course_id)
+        await _write_audit(db, enrollment_id, "deregistered", user_id, {"course_id": course_id})
         await db.commit()
 
     except HTTPException:
@@ -93,16 +122,21 @@ async def deregister(db: AsyncSession, user_id: str, enrollment_id: str) -> None
 
 async def admin_remove(db: AsyncSession, admin_id: str, enrollment_id: str) -> None:
     try:
-        result = await db.execute(select(Enrollment).where(Enrollment.id == enrollment_id))
-        enrollment = result.scalar_one_or_none()
-        if not enrollment:
+        result = await db.execute(
+            delete(Enrollment)
+            .where(Enrollment.id == enrollment_id)
+            .returning(Enrollment.course_id, Enrollment.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="enrollment not found")
 
+        await _release_seat(db, row.course_id)
         await _write_audit(
-            db, enrollment.id, "removed_by_admin", admin_id,
-            {"course_id": enrollment.course_id, "student_id": enrollment.user_id},
+            db, enrollment_id, "removed_by_admin", admin_id,
+            {"course_id": row.course_id, "student_id": row.user_id},
         )
-        await db.delete(enrollment)
         await db.commit()
 
     except HTTPException:
@@ -115,30 +149,69 @@ async def admin_remove(db: AsyncSession, admin_id: str, enrollment_id: str) -> N
         )
 
 
-async def list_all(db: AsyncSession, page: int, size: int):
+# rebuilds courses.enrolled_count from the enrollments table, returns how many courses were off
+async def reconcile_counts(db: AsyncSession) -> int:
     try:
-        count_q = select(sa_func.count()).select_from(Enrollment)
-        total_result = await db.execute(count_q)
+        actual = (
+            select(sa_func.count())
+            .select_from(Enrollment)
+            .where(Enrollment.course_id == Course.id)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(Course)
+            .where(Course.enrolled_count != actual)
+            .values(enrolled_count=actual, updated_at=Course.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount
+
+    except Exception:
+        await db.rollback()
+        raise
+
+
+def _enrollment_item(e: Enrollment) -> dict:
+    return {
+        "id": e.id,
+        "user_id": e.user_id,
+        "course_id": e.course_id,
+        "student_name": e.student.name if e.student else None,
+        "course_title": e.course.title if e.course else None,
+        "created_at": e.created_at,
+    }
+
+
+async def _page_enrollments(db: AsyncSession, filters: list, page: int, size: int, cursor: str | None, with_total: bool):
+    total = None
+    if with_total:
+        total_result = await db.execute(select(sa_func.count()).select_from(Enrollment).where(*filters))
         total = total_result.scalar()
 
-        offset = (page - 1) * size
-        q = select(Enrollment).offset(offset).limit(size).order_by(Enrollment.created_at.desc())
-        result = await db.execute(q)
-        enrollments = result.scalars().all()
+    q = select(Enrollment).where(*filters).order_by(Enrollment.created_at.desc(), Enrollment.id.desc())
+    if cursor:
+        q = q.where(after_cursor(Enrollment.created_at, Enrollment.id, cursor))
+    else:
+        q = q.offset((page - 1) * size)
+    result = await db.execute(q.limit(size + 1))
+    enrollments = result.scalars().all()
+
+    return {
+        "items": [_enrollment_item(e) for e in enrollments[:size]],
+        "total": total,
+        "page": page,
+        "size": size,
+        "next_cursor": next_cursor(enrollments, size),
+    }
 
-        items = []
-        for e in enrollments:
-            items.append({
-                "id": e.id,
-                "user_id": e.user_id,
-                "course_id": e.course_id,
-                "student_name": e.student.name if e.student else None,
-                "course_title": e.course.title if e.course else None,
-                "created_at": e.created_at,
-            })
 
-        return {"items": items, "total": total, "page": page, "size": size}
+async def list_all(db: AsyncSession, page: int, size: int, cursor: str | None = None, with_total: bool = True):
+    try:
+        return await _page_enrollments(db, [], page, size, cursor, with_total)
 
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -146,36 +219,19 @@ async def list_all(db: AsyncSession, page: int, size: int):
         )
 
 
-async def list_by_course(db: AsyncSession, course_id: str, page: int, size: int):
+async def list_by_course(
+    db: AsyncSession,
+    course_id: str,
+    page: int,
+    size: int,
+    cursor: str | None = None,
+    with_total: bool = True,
+):
     try:
-        count_q = select(sa_func.count()).select_from(Enrollment).where(Enrollment.course_id == course_id)
-        total_result = await db.execute(count_q)
-        total = total_result.scalar()
-
-        offset = (page - 1) * size
-        q = (
-            select(Enrollment)
-            .where(Enrollment.course_id == course_id)
-            .offset(offset)
-            .limit(size)
-            .order_by(Enrollment.created_at.desc())
-        )
-        result = await db.execute(q)
-        enrollments = result.scalars().all()
-
-        items = []
-        for e in enrollments:
-            items.append({
-                "id": e.id,
-                "user_id": e.user_id,
-                "course_id": e.course_id,
-                "student_name": e.student.name if e.student else None,
-                "course_title": e.course.title if e.course else None,
-                "created_at": e.created_at,
-            })
-
-        return {"items": items, "total": total, "page": page, "size": size}
+        return await _page_enrollments(db, [Enrollment.course_id == course_id], page, size, cursor, with_total)
 
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,34 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid cursor")
+
+
+def after_cursor(ts_col, id_col, cursor: str):
+    # rows strictly after the cursor in (ts desc, id desc) order
+    ts, row_id = decode_cursor(cursor)
+    return or_(ts_col < ts, and_(ts_col == ts, id_col < row_id))
+
+
+def next_cursor(rows: list, size: int, ts_attr: str = "created_at") -> str | None:
+    if len(rows) <= size:
+        return None
+    last = rows[size - 1]
+    return encode_cursor(getattr(last, ts_attr), last.id)
@@ -0,0 +1,23 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("courses") as batch:
+        batch.add_column(sa.Column("enrolled_count", sa.Integer, nullable=False, server_default="0"))
+
+    op.execute(
+        "UPDATE courses SET enrolled_count = "
+        "(SELECT COUNT(*) FROM enrollments WHERE enrollments.course_id = courses.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("courses") as batch:
+        batch.drop_column("enrolled_count")
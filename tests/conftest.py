@@ -128,7 +128,7 @@ async def inactive_course():
 @pytest_asyncio.fixture
 async def full_course(student_in_db):
     async with TestSession() as db:
-        c = Course(id="course-full", title="Packed Room", code="FULL01", capacity=1)
+        c = Course(id="course-full", title="Packed Room", code="FULL01", capacity=1, enrolled_count=1)
         db.add(c)
         await db.flush()
         filler = User(id="filler-001", name="Filler", email="filler@test.com", hashed_password=hash_pw("fill1234"), role="student")
@@ -167,3 +167,33 @@ async def test_inactive_courses_hidden_from_public_list(client, inactive_course)
     resp = await client.get("/courses")
     data = resp.json()
     assert data["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_courses_cursor_walk(client, admin_in_db, admin_token):
+    for i in range(5):
+        await client.post(
+            "/courses",
+            json={"title": f"Course {i}", "code": f"CUR{i:02d}", "capacity": 10},
+            headers=auth_header(admin_token),
+        )
+
+    seen = []
+    resp = await client.get("/courses?size=2&with_total=false")
+    data = resp.json()
+    assert data["total"] is None
+    seen += [c["code"] for c in data["items"]]
+    while data["next_cursor"]:
+        resp = await client.get(f"/courses?size=2&with_total=false&cursor={data['next_cursor']}")
+        assert resp.status_code == 200
+        data = resp.json()
+        seen += [c["code"] for c in data["items"]]
+
+    assert sorted(seen) == [f"CUR{i:02d}" for i in range(5)]
+    assert len(seen) == len(set(seen))
+
+
+@pytest.mark.asyncio
+async def test_list_courses_bad_cursor(client):
+    resp = await client.get("/courses?cursor=not-a-real-cursor")
+    assert resp.status_code == 400
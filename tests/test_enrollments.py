@@ -1,7 +1,11 @@
 import pytest
 from tests.conftest import auth_header, TestSession
 from app.models.audit import AuditLog
-from sqlalchemy import select
+from app.models.course import Course
+from app.models.user import User
+from app.services import enrollment_svc
+from app.utils.security import mint_token
+from sqlalchemy import select, update
 
 
 @pytest.mark.asyncio
@@ -212,3 +216,78 @@ async def test_enrollment_list_pagination(client, student_in_db, student_token,
 async def test_no_auth_enroll(client, sample_course):
     resp = await client.post("/enrollments", json={"course_id": sample_course.id})
     assert resp.status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_enroll_updates_seat_counter(client, student_in_db, student_token, sample_course):
+    enroll_resp = await client.post(
+        "/enrollments",
+        json={"course_id": sample_course.id},
+        headers=auth_header(student_token),
+    )
+    async with TestSession() as db:
+        course = await db.get(Course, sample_course.id)
+        assert course.enrolled_count == 1
+
+    await client.delete(f"/enrollments/{enroll_resp.json()['id']}", headers=auth_header(student_token))
+    async with TestSession() as db:
+        course = await db.get(Course, sample_course.id)
+        assert course.enrolled_count == 0
+
+
+@pytest.mark.asyncio
+async def test_enroll_never_oversells(client, sample_course):
+    tokens = []
+    for i in range(4):
+        async with TestSession() as db:
+            db.add(User(id=f"rush-{i}", name=f"Rush {i}", email=f"rush{i}@test.com", hashed_password="x", role="student"))
+            await db.commit()
+        tokens.append(mint_token(f"rush-{i}"))
+
+    resps = []
+    for t in tokens:
+        resps.append(await client.post("/enrollments", json={"course_id": sample_course.id}, headers=auth_header(t)))
+    assert sorted(r.status_code for r in resps) == [201, 201, 400, 400]
+
+    async with TestSession() as db:
+        course = await db.get(Course, sample_course.id)
+        assert course.enrolled_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reconcile_counts(client, full_course):
+    async with TestSession() as db:
+        await db.execute(update(Course).where(Course.id == full_course.id).values(enrolled_count=7))
+        await db.commit()
+
+    async with TestSession() as db:
+        fixed = await enrollment_svc.reconcile_counts(db)
+    assert fixed == 1
+
+    async with TestSession() as db:
+        course = await db.get(Course, full_course.id)
+        assert course.enrolled_count == 1
+
+
+@pytest.mark.asyncio
+async def test_enrollment_list_cursor(client, student_in_db, student_token, admin_in_db, admin_token):
+    for i in range(3):
+        await client.post(
+            "/courses",
+            json={"title": f"Cursor {i}", "code": f"CRS{i:02d}", "capacity": 50},
+            headers=auth_header(admin_token),
+        )
+    courses_resp = await client.get("/courses?size=100")
+    for c in courses_resp.json()["items"]:
+        await client.post("/enrollments", json={"course_id": c["id"]}, headers=auth_header(student_token))
+
+    first = (await client.get("/enrollments?size=2&with_total=false", headers=auth_header(admin_token))).json()
+    assert first["total"] is None
+    assert len(first["items"]) == 2
+    assert first["next_cursor"]
+
+    second = (await client.get(f"/enrollments?size=2&cursor={first['next_cursor']}", headers=auth_header(admin_token))).json()
+    assert len(second["items"]) == 1
+    assert second["total"] == 3
+    assert second["next_cursor"] is None
+    assert second["items"][0]["id"] not in {e["id"] for e in first["items"]}